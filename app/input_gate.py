@@ -0,0 +1,142 @@
+import re
+from typing import Optional
+
+from app.models import ExtractionVariables, InputCompleteness
+
+# Narratives that are too short or state no decision never reach the API,
+# whatever the form fields say; neither do scores below BLOCK_THRESHOLD or
+# negative form values. Scores below THIN_THRESHOLD and inconsistent extracted
+# variables run the core pipeline but skip the optional drift comparison,
+# with the reason returned to the UI.
+BLOCK_THRESHOLD = 35.0
+THIN_THRESHOLD = 60.0
+
+MIN_WORDS = 15
+TARGET_WORDS = 80
+
+_WORD_RE = re.compile(r"[A-Za-z0-9$%'’-]+")
+_DECISION_RE = re.compile(
+    r"\b(should (i|we)|whether|(am|are) (i|we) (going to|better off)|do (i|we) (take|keep|sell|buy|stay|leave|accept|wait)|"
+    r"deciding|decide|decision|choos(e|ing) between|torn between|weighing (up )?(whether|the|two|my)|"
+    r"(considering|thinking (about|of)) (whether|taking|leaving|accepting|selling|buying|quitting|moving|switching|"
+    r"renting|refinancing|investing)|versus|vs\.?)\b",
+    re.IGNORECASE,
+)
+# "Stay or go?" — an either/or question counts as stated options
+_EITHER_OR_RE = re.compile(r"[^.?!]*\bor\b[^.?!]*\?")
+_NUMERIC_RE = re.compile(r"\$\s?\d|\d[\d,.]*\s?(k|m|%|percent|dollars|usd)\b|\b\d{2,}", re.IGNORECASE)
+_COUNT = r"(\d+|a|an|one|two|three|four|five|six|seven|eight|nine|ten|twelve|eighteen|few|several|couple of)"
+_UNIT = r"(day|week|month|quarter|year)s?"
+# Future-facing horizons only — "worked here five years" is tenure, not a horizon
+_HORIZON_RE = re.compile(
+    rf"\b(in|within|over) (the )?(next )?{_COUNT} {_UNIT}\b|"
+    rf"\bnext ({_COUNT} )?{_UNIT}\b|"
+    rf"\b{_COUNT} {_UNIT} from now\b|"
+    rf"\b{_COUNT}[- ]{_UNIT} (horizon|plan|window|deadline)\b|"
+    r"\b(by|before|until) (the end of |end of )?(this |next )?"
+    r"(january|february|march|april|may|june|july|august|september|october|november|december|"
+    r"spring|summer|fall|autumn|winter|(19|20)\d{2}|year|quarter|month)\b|"
+    r"\bdeadline\b",
+    re.IGNORECASE,
+)
+
+
+def score_input(
+    decision_narrative: str,
+    monthly_burn: Optional[float] = None,
+    runway_months: Optional[float] = None,
+    income_delta: Optional[float] = None,
+    downside_limit: float = 0.0,
+) -> InputCompleteness:
+    """Deterministic pre-flight completeness score — code-generated, no API calls."""
+    text = decision_narrative.strip()
+    word_count = len(_WORD_RE.findall(text))
+
+    checks = {
+        "sufficient_length": word_count >= MIN_WORDS,
+        "decision_or_option": bool(_DECISION_RE.search(text) or _EITHER_OR_RE.search(text)),
+    }
+    # Form fields only count once the narrative itself is analyzable
+    narrative_passes = checks["sufficient_length"] and checks["decision_or_option"]
+    has_numbers = narrative_passes and any(v is not None for v in (monthly_burn, runway_months, income_delta))
+    checks["numeric_signals"] = has_numbers or bool(_NUMERIC_RE.search(text))
+    checks["time_horizon"] = (narrative_passes and runway_months is not None) or bool(_HORIZON_RE.search(text))
+
+    # Invalid form values block outright — income_delta may legitimately be negative
+    invalid = []
+    if monthly_burn is not None and monthly_burn < 0:
+        invalid.append("Monthly expenses cannot be negative.")
+    if runway_months is not None and runway_months < 0:
+        invalid.append("Financial runway cannot be negative.")
+    if downside_limit < 0:
+        invalid.append("Downside limit cannot be negative.")
+
+    length_score = 30.0 * min(word_count, TARGET_WORDS) / TARGET_WORDS
+    score = (
+        length_score
+        + (25.0 if checks["decision_or_option"] else 0.0)
+        + (25.0 if checks["numeric_signals"] else 0.0)
+        + (20.0 if checks["time_horizon"] else 0.0)
+    )
+    score = round(max(0.0, min(100.0, score)), 1)
+
+    prompts = []
+    if not checks["sufficient_length"]:
+        prompts.append("Describe the situation in a few more sentences — what is happening and why now?")
+    if not checks["decision_or_option"]:
+        prompts.append("State the decision itself: what options are you choosing between?")
+    if not checks["numeric_signals"]:
+        prompts.append("Add at least one number — monthly expenses, savings runway, or the income change involved.")
+    if not checks["time_horizon"]:
+        prompts.append("Give a time horizon: when must you decide, and over how many months will it play out?")
+    prompts.extend(invalid)
+
+    if not narrative_passes or invalid or score < BLOCK_THRESHOLD:
+        status = "blocked"
+    elif score < THIN_THRESHOLD:
+        status = "thin"
+    else:
+        status = "ok"
+
+    return InputCompleteness(
+        score=score,
+        status=status,
+        word_count=word_count,
+        checks=checks,
+        contradictions=invalid,
+        missing_field_prompts=prompts,
+    )
+
+
+def check_variables(completeness: InputCompleteness, variables: ExtractionVariables) -> InputCompleteness:
+    """Post-extraction consistency checks across ExtractionVariables — code-generated, no API calls."""
+    contradictions = []
+    for name, label in (
+        ("monthly_burn", "Monthly expenses"),
+        ("runway_months", "Financial runway"),
+        ("liquidity_need_months", "Liquidity need"),
+    ):
+        value = getattr(variables, name)
+        if value is not None and value < 0:
+            contradictions.append(f"{label} was read as negative ({value:g}) — check the narrative.")
+
+    runway, need = variables.runway_months, variables.liquidity_need_months
+    if runway is not None and need is not None and 0 <= runway < need:
+        contradictions.append(
+            f"You need {need:g} months of liquidity but have {runway:g} months of runway — "
+            "confirm which figure is right, or how the gap will be covered."
+        )
+    if runway is not None and runway > 0 and variables.monthly_burn == 0:
+        contradictions.append("A runway was given but monthly expenses are zero — runway depends on expenses.")
+
+    if not contradictions:
+        return completeness
+    score = round(max(0.0, completeness.score - 15.0 * len(contradictions)), 1)
+    return completeness.model_copy(
+        update={
+            "score": score,
+            "status": "thin",
+            "contradictions": completeness.contradictions + contradictions,
+            "missing_field_prompts": completeness.missing_field_prompts + contradictions,
+        }
+    )
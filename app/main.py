@@ -12,6 +12,8 @@ from fastapi.staticfiles import StaticFiles
 from pydantic import ValidationError
 
 from app.claude_client import call_claude
+from app.input_gate import check_variables, score_input
+from app.narrative_index import NarrativeIndex, StageOutputs, guard_tokens
 from app.models import (
     AnalysisResponse,
     DecisionLog,
@@ -44,6 +46,10 @@ DISCLAIMER = "Not financial advice. Decision support only."
 app = FastAPI(title="Axis — Financial Decision Stabilization Layer")
 app.mount("/static", StaticFiles(directory=str(BASE_DIR / "static")), name="static")
 
+# In-process only — holds validated stage outputs, never written to disk.
+# Shared across all submitters; see README Privacy before enabling "near".
+narrative_index = NarrativeIndex(mode=os.getenv("AXIS_NARRATIVE_REUSE", "off").strip().lower())
+
 
 def get_volatility_label(score: float) -> str:
     """Deterministic mapping — code-generated, not AI-generated."""
@@ -70,6 +76,11 @@ async def sample_prior():
     return FileResponse(path, media_type="application/json", filename="axis_sample_prior_log.json")
 
 
+@app.get("/api/reuse_stats")
+async def reuse_stats():
+    return narrative_index.stats.as_dict()
+
+
 @app.post("/api/analyze")
 async def analyze(
     decision_narrative: str = Form(...),
@@ -86,6 +97,19 @@ async def analyze(
     if not api_key:
         raise HTTPException(status_code=500, detail="CLAUDE_API_KEY is not set in environment.")
 
+    # ── Pre-flight: local completeness gate (no API calls) ────────────────
+    completeness = score_input(decision_narrative, monthly_burn, runway_months, income_delta, downside_limit)
+    if completeness.status == "blocked":
+        if completeness.contradictions:
+            raise HTTPException(status_code=422, detail="Invalid input: " + " ".join(completeness.contradictions))
+        raise HTTPException(
+            status_code=422,
+            detail=(
+                f"Narrative too thin to analyze reliably (completeness {completeness.score:.0f}/100). "
+                + " ".join(completeness.missing_field_prompts)
+            ),
+        )
+
     # Parse prior log if provided
     prior_log: Optional[dict] = None
     if prior_log_file and prior_log_file.filename:
@@ -110,12 +134,23 @@ async def analyze(
     if numeric_lines:
         narrative_with_context += "\n\nUser-provided numeric context:\n" + "\n".join(numeric_lines)
 
+    # ── Reuse lookup: exact match reuses every stage, near-duplicate only extraction ──
+    prior_run, exact_match = narrative_index.lookup(narrative_with_context, model)
+    guard = guard_tokens(narrative_with_context)
+    reuse_extraction = prior_run is not None and prior_run.guard == guard
+    calls_avoided = 0
+
     # ── Call 1: Extraction (sequential) ───────────────────────────────────
-    try:
-        extraction_raw = await call_claude(EXTRACTION_SYSTEM, narrative_with_context, model, api_key)
-        extraction = ExtractionOutput(**extraction_raw)
-    except (ValueError, ValidationError) as e:
-        raise HTTPException(status_code=502, detail=f"Extraction step failed: {e}")
+    if reuse_extraction:
+        extraction = prior_run.extraction.model_copy(deep=True)
+        calls_avoided += 1
+    else:
+        try:
+            extraction_raw = await call_claude(EXTRACTION_SYSTEM, narrative_with_context, model, api_key)
+            extraction = ExtractionOutput(**extraction_raw)
+        except (ValueError, ValidationError) as e:
+            raise HTTPException(status_code=502, detail=f"Extraction step failed: {e}")
+    model_extraction = extraction.model_copy(deep=True)
 
     # User-provided values take precedence over AI-extracted
     if monthly_burn is not None:
@@ -126,6 +161,7 @@ async def analyze(
         extraction.variables.income_delta = income_delta
 
     extraction_dict = extraction.model_dump()
+    completeness = check_variables(completeness, extraction.variables)
 
     # ── Calls 2, 3, 4: Parallel ───────────────────────────────────────────
     enriched_context = (
@@ -133,17 +169,23 @@ async def analyze(
         f"Extracted variables:\n{json.dumps(extraction_dict, indent=2)}"
     )
 
-    try:
-        tradeoff_raw, volatility_raw, scenario_raw = await asyncio.gather(
-            call_claude(TRADEOFF_SYSTEM, enriched_context, model, api_key),
-            call_claude(VOLATILITY_SYSTEM, enriched_context, model, api_key),
-            call_claude(SCENARIO_SYSTEM, enriched_context, model, api_key),
-        )
-        tradeoff = TradeoffOutput(**tradeoff_raw)
-        volatility = VolatilityOutput(**volatility_raw)
-        scenario = ScenarioOutput(**scenario_raw)
-    except (ValueError, ValidationError) as e:
-        raise HTTPException(status_code=502, detail=f"Analysis step failed: {e}")
+    # Calls 2–6 see the full narrative text, so only an exact match leaves their inputs unchanged
+    reuse_analysis = reuse_extraction and exact_match
+    if reuse_analysis:
+        tradeoff, volatility, scenario = prior_run.tradeoff, prior_run.volatility, prior_run.scenario
+        calls_avoided += 3
+    else:
+        try:
+            tradeoff_raw, volatility_raw, scenario_raw = await asyncio.gather(
+                call_claude(TRADEOFF_SYSTEM, enriched_context, model, api_key),
+                call_claude(VOLATILITY_SYSTEM, enriched_context, model, api_key),
+                call_claude(SCENARIO_SYSTEM, enriched_context, model, api_key),
+            )
+            tradeoff = TradeoffOutput(**tradeoff_raw)
+            volatility = VolatilityOutput(**volatility_raw)
+            scenario = ScenarioOutput(**scenario_raw)
+        except (ValueError, ValidationError) as e:
+            raise HTTPException(status_code=502, detail=f"Analysis step failed: {e}")
 
     # ── Build human boundary gate (gate confirmed client-side after render) ──
     gate = HumanBoundaryGate(
@@ -172,12 +214,28 @@ async def analyze(
     )
 
     # ── Calls 5, 6, [7]: Final summary + Executive snapshot + [Drift] in parallel ──
-    tasks = [
-        call_claude(FINAL_SUMMARY_SYSTEM, full_context, model, api_key),
-        call_claude(EXECUTIVE_SNAPSHOT_SYSTEM, snapshot_context, model, api_key),
-    ]
-
-    if prior_log:
+    tasks = []
+    if reuse_analysis:
+        calls_avoided += 2
+    else:
+        tasks.append(call_claude(FINAL_SUMMARY_SYSTEM, full_context, model, api_key))
+        tasks.append(call_claude(EXECUTIVE_SNAPSHOT_SYSTEM, snapshot_context, model, api_key))
+
+    # Thin inputs skip drift comparison — differences would reflect missing context, not drift
+    run_drift = bool(prior_log) and completeness.status == "ok"
+    drift_skipped_reason: Optional[str] = None
+    if prior_log and not run_drift:
+        if completeness.contradictions:
+            drift_skipped_reason = (
+                "Drift comparison skipped: the figures in this narrative are inconsistent, "
+                "so differences from the prior log would not reflect real drift."
+            )
+        else:
+            drift_skipped_reason = (
+                f"Drift comparison skipped: this narrative scored {completeness.score:.0f}/100 for completeness, "
+                "so differences from the prior log would reflect missing context rather than real drift."
+            )
+    if run_drift:
         current_partial = {
             "executive_snapshot": {},  # not yet assembled
             "extraction": extraction_dict,
@@ -193,22 +251,42 @@ async def analyze(
         tasks.append(call_claude(DRIFT_SYSTEM, drift_context, model, api_key))
 
     try:
-        results = await asyncio.gather(*tasks)
+        results = list(await asyncio.gather(*tasks))
     except (ValueError, ValidationError) as e:
         raise HTTPException(status_code=502, detail=f"Summary/snapshot step failed: {e}")
 
-    summary_raw = results[0]
-    snapshot_raw = results[1]
-    drift_raw = results[2] if prior_log else None
+    drift_raw = results.pop() if run_drift else None
 
-    # ── Assemble executive snapshot (code adds deterministic fields) ───────
-    try:
-        snapshot_raw["volatility_score"] = volatility.volatility_score_0_to_100
-        snapshot_raw["volatility_label"] = get_volatility_label(volatility.volatility_score_0_to_100)
-        executive_snapshot = ExecutiveSnapshot(**snapshot_raw)
-        final_summary = FinalSummaryOutput(**summary_raw)
-    except ValidationError as e:
-        raise HTTPException(status_code=502, detail=f"Snapshot/summary validation failed: {e}")
+    if reuse_analysis:
+        executive_snapshot = prior_run.executive_snapshot
+        final_summary = prior_run.final_summary
+    else:
+        summary_raw, snapshot_raw = results
+
+        # ── Assemble executive snapshot (code adds deterministic fields) ───────
+        try:
+            snapshot_raw["volatility_score"] = volatility.volatility_score_0_to_100
+            snapshot_raw["volatility_label"] = get_volatility_label(volatility.volatility_score_0_to_100)
+            executive_snapshot = ExecutiveSnapshot(**snapshot_raw)
+            final_summary = FinalSummaryOutput(**summary_raw)
+        except ValidationError as e:
+            raise HTTPException(status_code=502, detail=f"Snapshot/summary validation failed: {e}")
+
+        # A borrowed extraction was never derived from this narrative — don't store it under its digest
+        if not reuse_extraction:
+            narrative_index.add(
+                narrative_with_context,
+                StageOutputs(
+                    model=model,
+                    guard=guard,
+                    extraction=model_extraction,
+                    tradeoff=tradeoff,
+                    volatility=volatility,
+                    scenario=scenario,
+                    final_summary=final_summary,
+                    executive_snapshot=executive_snapshot,
+                ),
+            )
 
     drift_report: Optional[DriftReport] = None
     if drift_raw:
@@ -243,4 +321,11 @@ async def analyze(
         final_summary=final_summary,
     )
 
-    return AnalysisResponse(decision_log=decision_log, drift_report=drift_report)
+    narrative_index.record(6 - calls_avoided + (1 if run_drift else 0), calls_avoided)
+
+    return AnalysisResponse(
+        decision_log=decision_log,
+        drift_report=drift_report,
+        input_completeness=completeness,
+        drift_skipped_reason=drift_skipped_reason,
+    )
@@ -136,6 +136,15 @@ class DriftReport(BaseModel):
     stabilization_advice: List[str]
 
 
+class InputCompleteness(BaseModel):
+    score: float                     # 0–100, code-generated pre-flight score
+    status: str                      # "ok" | "thin" | "blocked"
+    word_count: int
+    checks: Dict[str, bool]
+    contradictions: List[str]
+    missing_field_prompts: List[str]
+
+
 class DecisionLog(BaseModel):
     meta: MetaInfo
     input: InputData
@@ -151,3 +160,5 @@ class DecisionLog(BaseModel):
 class AnalysisResponse(BaseModel):
     decision_log: DecisionLog
     drift_report: Optional[DriftReport] = None
+    input_completeness: Optional[InputCompleteness] = None
+    drift_skipped_reason: Optional[str] = None
@@ -0,0 +1,205 @@
+import hashlib
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from app.models import (
+    ExecutiveSnapshot,
+    ExtractionOutput,
+    FinalSummaryOutput,
+    ScenarioOutput,
+    TradeoffOutput,
+    VolatilityOutput,
+)
+
+# Reuse modes (AXIS_NARRATIVE_REUSE):
+#   off   — never reuse (default)
+#   exact — reuse all stages when the normalized narrative + numeric context is identical
+#   near  — additionally reuse the extraction for near-duplicates with identical signed numbers
+#           and polarity words (single-user deployments only:
+#           the reused extraction was derived from someone else's narrative)
+REUSE_MODES = ("off", "exact", "near")
+
+# MinHash over word shingles, banded for locality-sensitive lookup.
+# 32 bands x 4 rows puts the candidate cutoff near Jaccard 0.42, well below
+# SIMILARITY_THRESHOLD, so near-duplicates are almost never missed.
+NUM_PERM = 128
+BANDS = 32
+ROWS = NUM_PERM // BANDS
+SHINGLE_SIZE = 3
+SIMILARITY_THRESHOLD = 0.9
+MAX_ENTRIES = 256
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_PERMUTATIONS = [
+    (
+        int.from_bytes(hashlib.blake2b(f"a{i}".encode(), digest_size=8).digest(), "big") % _MERSENNE_PRIME or 1,
+        int.from_bytes(hashlib.blake2b(f"b{i}".encode(), digest_size=8).digest(), "big") % _MERSENNE_PRIME,
+    )
+    for i in range(NUM_PERM)
+]
+
+_TOKEN_RE = re.compile(r"[a-z0-9$%.]+")
+_NUMBER_RE = re.compile(r"([+\-−]?)\s?\$?\s?([+\-−]?)(\d[\d,.]*)")
+# Words that flip or reverse meaning without changing the shingle set much
+_POLARITY_RE = re.compile(
+    r"\b(not|no|never|none|nothing|without|cannot|\w+n['’]t|up|down|more|less|fewer|higher|lower|"
+    r"gain\w*|loss\w*|lose|losing|increas\w*|decreas\w*|rais\w*|cut\w*|drop\w*)\b"
+)
+
+
+def normalize(text: str) -> List[str]:
+    """Lowercase word tokens — punctuation and whitespace differences are ignored."""
+    return [t.strip(".") for t in _TOKEN_RE.findall(text.lower()) if t.strip(".")]
+
+
+def guard_tokens(text: str) -> Tuple[str, ...]:
+    """Signed numbers and polarity words, in order — any change means extraction must re-run."""
+    numbers = tuple(
+        ("-" if (before or after) in ("-", "−") else "") + n.rstrip(".,").replace(",", "")
+        for before, after, n in _NUMBER_RE.findall(text)
+    )
+    return numbers + tuple(_POLARITY_RE.findall(text.lower()))
+
+
+def digest(tokens: List[str]) -> str:
+    return hashlib.sha256(" ".join(tokens).encode()).hexdigest()
+
+
+def minhash(tokens: List[str]) -> Tuple[int, ...]:
+    if len(tokens) < SHINGLE_SIZE:
+        shingles = {" ".join(tokens)}
+    else:
+        shingles = {" ".join(tokens[i : i + SHINGLE_SIZE]) for i in range(len(tokens) - SHINGLE_SIZE + 1)}
+    hashes = [int.from_bytes(hashlib.blake2b(s.encode(), digest_size=4).digest(), "big") for s in shingles]
+    return tuple(
+        min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+        for a, b in _PERMUTATIONS
+    )
+
+
+def similarity(sig_a: Tuple[int, ...], sig_b: Tuple[int, ...]) -> float:
+    """Estimated Jaccard similarity of the two shingle sets."""
+    return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / NUM_PERM
+
+
+@dataclass
+class StageOutputs:
+    """Validated outputs of one completed pipeline run."""
+    model: str
+    guard: Tuple[str, ...]
+    extraction: ExtractionOutput          # as returned by the model, before user overrides
+    tradeoff: TradeoffOutput
+    volatility: VolatilityOutput
+    scenario: ScenarioOutput
+    final_summary: FinalSummaryOutput
+    executive_snapshot: ExecutiveSnapshot
+
+
+@dataclass
+class ReuseStats:
+    lookups: int = 0
+    hits: int = 0
+    calls_total: int = 0
+    calls_avoided: int = 0
+
+    def record(self, calls_made: int, calls_avoided: int, looked_up: bool) -> None:
+        """Record one fully built response — failed requests are never recorded."""
+        if looked_up:
+            self.lookups += 1
+        self.calls_total += calls_made + calls_avoided
+        self.calls_avoided += calls_avoided
+        if calls_avoided:
+            self.hits += 1
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "calls_total": self.calls_total,
+            "calls_avoided": self.calls_avoided,
+            "reuse_rate": round(self.calls_avoided / self.calls_total, 4) if self.calls_total else 0.0,
+        }
+
+
+class NarrativeIndex:
+    """Bounded LRU index of recent runs — exact lookup by digest, near lookup by MinHash LSH bands."""
+
+    def __init__(self, mode: str = "off", max_entries: int = MAX_ENTRIES, threshold: float = SIMILARITY_THRESHOLD):
+        if mode not in REUSE_MODES:
+            raise ValueError(f"AXIS_NARRATIVE_REUSE must be one of {', '.join(REUSE_MODES)}, got {mode!r}")
+        self.mode = mode
+        self.max_entries = max_entries
+        self.threshold = threshold
+        self.stats = ReuseStats()
+        self._entries: "OrderedDict[int, Tuple[str, Tuple[int, ...], StageOutputs]]" = OrderedDict()
+        self._exact: Dict[Tuple[str, str], int] = {}
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], set] = {}
+        self._next_id = 0
+
+    def _bands(self, signature: Tuple[int, ...]):
+        for band in range(BANDS):
+            yield band, signature[band * ROWS : (band + 1) * ROWS]
+
+    def lookup(self, narrative: str, model: str) -> Tuple[Optional[StageOutputs], bool]:
+        """Return a prior run (or None) and whether it matched the normalized narrative exactly."""
+        if self.mode == "off":
+            return None, False
+        tokens = normalize(narrative)
+
+        entry_id = self._exact.get((model, digest(tokens)))
+        if entry_id is not None:
+            self._entries.move_to_end(entry_id)
+            return self._entries[entry_id][2], True
+        if self.mode != "near":
+            return None, False
+
+        signature = minhash(tokens)
+        candidates = set()
+        for key in self._bands(signature):
+            candidates |= self._buckets.get(key, set())
+
+        best_id, best_score = None, self.threshold
+        for candidate_id in candidates:
+            _, candidate_sig, entry = self._entries[candidate_id]
+            if entry.model != model:
+                continue
+            score = similarity(signature, candidate_sig)
+            if score >= best_score:
+                best_id, best_score = candidate_id, score
+
+        if best_id is None:
+            return None, False
+        self._entries.move_to_end(best_id)
+        return self._entries[best_id][2], False
+
+    def record(self, calls_made: int, calls_avoided: int) -> None:
+        self.stats.record(calls_made, calls_avoided, looked_up=self.mode != "off")
+
+    def add(self, narrative: str, entry: StageOutputs) -> None:
+        if self.mode == "off":
+            return
+        tokens = normalize(narrative)
+        key = digest(tokens)
+        if (entry.model, key) in self._exact:
+            return
+        signature = minhash(tokens) if self.mode == "near" else ()
+
+        entry_id = self._next_id
+        self._next_id += 1
+        self._entries[entry_id] = (key, signature, entry)
+        self._exact[(entry.model, key)] = entry_id
+        for band_key in self._bands(signature) if signature else ():
+            self._buckets.setdefault(band_key, set()).add(entry_id)
+
+        while len(self._entries) > self.max_entries:
+            old_id, (old_key, old_sig, old) = self._entries.popitem(last=False)
+            del self._exact[(old.model, old_key)]
+            for band_key in self._bands(old_sig) if old_sig else ():
+                bucket = self._buckets.get(band_key)
+                if bucket is not None:
+                    bucket.discard(old_id)
+                    if not bucket:
+                        del self._buckets[band_key]